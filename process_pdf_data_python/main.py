@@ -2,22 +2,91 @@ import fitz  # PyMuPDF
 import json
 import re
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    import orjson  # much faster C serializer; falls back to stdlib json
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick  # single-pass multi-keyword scan; optional
+except ImportError:
+    ahocorasick = None
+
+
+# Compiled once at import time; these all run inside per-line loops.
+# re.ASCII skips Unicode case-folding where the literal text is plain
+# ASCII; the remaining IGNORECASE patterns need it for Czech diacritics.
+_STRANA_RE = re.compile(r"^\s*strana \d+\s*$", re.IGNORECASE | re.ASCII)
+_PAGENUM_RE = re.compile(r"^\s*\d+\s*$")
+_LAW_ID_RE = re.compile(r"(\d+/\d{4})\s+Sb\.")
+_ZE_DNE_PREFIX_RE = re.compile(r"^\s*ze dne\s+\d+\.\s+\w+\s+\d{4}\s*", re.IGNORECASE)
+_DOC_TYPE_PREFIX_RE = re.compile(r"^(ZÁKON|VYHLÁŠKA|NAŘÍZENÍ VLÁDY)\s*", re.IGNORECASE)
+_DATE_RE = re.compile(r"ze dne (\d{1,2}\. \w+ \d{4})", re.IGNORECASE)
+_EFFECTIVE_RE = re.compile(r"nabývá účinnosti dnem\s+(.*)", re.IGNORECASE)
+# Complex "§ ... zákona č. ..." references first so the fuller form wins
+# over the bare "zákon č. ..." alternative it contains.
+_REFS_RE = re.compile(
+    r"(§\s*\d+[a-z]?\s*(?:odst\.\s*\d+)?\s*(?:písm\.\s*[a-z]\))?\s*zákona č\.\s*\d+/\d{4}\s*Sb\."
+    r"|zákon(?:a|u|ě)? č\.\s*\d+/\d{4}\s*Sb\.)",
+    re.IGNORECASE)
+
+# Boilerplate phrases dropped by clean_text, all lowercase. With
+# pyahocorasick installed they are found in one pass per line; otherwise
+# plain substring checks are used.
+_SBIRKA_KEYWORD = "sbírka zákonů"
+_ROCNIK_KEYWORD = "ročník"
+_MINISTERSTVO_KEYWORD = "© ministerstvo vnitra"
+
+if ahocorasick is not None:
+    _BOILERPLATE_AC = ahocorasick.Automaton()
+    for _keyword in (_SBIRKA_KEYWORD, _ROCNIK_KEYWORD, _MINISTERSTVO_KEYWORD):
+        _BOILERPLATE_AC.add_word(_keyword, _keyword)
+    _BOILERPLATE_AC.make_automaton()
+else:
+    _BOILERPLATE_AC = None
+
+# All five structural probes fused into one alternation so each line is
+# classified with a single match call; branch on match.lastgroup. Scoped
+# (?i:...) keeps the part/head alternatives case-insensitive without
+# loosening the paragraph/subsection ones.
+_STRUCT_RE = re.compile(
+    r"^\s*(?:(?i:ČÁST)\s+(?P<part>[A-Za-z]+)"
+    r"|(?i:HLAVA)\s+(?P<head>[IVXLCDMivxlcdm]+)"
+    r"|§\s*(?P<para>\d+[a-z]?)"
+    r"|\((?P<sub1>\d+)\)"
+    r"|(?P<sub2>[a-z])\))")
+
+# First characters a stripped structural line can start with; everything
+# else is running text, so the regex engine never needs to see it. The
+# only alternative not covered by a lead char is "a)" style, caught by
+# the second-char ')' probe at the call site.
+_STRUCT_LEAD_CHARS = frozenset("§(ČčHh")
 
 
 def clean_text(text_lines):
 
     cleaned_lines = []
     for line in text_lines:
-
-        if re.match(r"^\s*strana \d+\s*$", line, re.IGNORECASE) or \
-                re.match(r"^\s*\d+\s*$", line) and len(cleaned_lines) % 50 == 0:
-            continue
-        if "sbírka zákonů" in line.lower() and "ročník" in line.lower():
+        stripped = line.strip()
+        if not stripped:
             continue
-        if "© Ministerstvo vnitra" in line:
+        if _STRANA_RE.match(line) or _PAGENUM_RE.match(line):
             continue
-        cleaned_lines.append(line.strip())
-    return [line for line in cleaned_lines if line]
+        low = line.lower()
+        if _BOILERPLATE_AC is not None:
+            hits = {keyword for _, keyword in _BOILERPLATE_AC.iter(low)}
+            if _MINISTERSTVO_KEYWORD in hits or \
+                    (_SBIRKA_KEYWORD in hits and _ROCNIK_KEYWORD in hits):
+                continue
+        else:
+            if _SBIRKA_KEYWORD in low and _ROCNIK_KEYWORD in low:
+                continue
+            if _MINISTERSTVO_KEYWORD in low:
+                continue
+        cleaned_lines.append(stripped)
+    return cleaned_lines
 
 
 def extract_metadata(text_content_lines):
@@ -33,56 +102,48 @@ def extract_metadata(text_content_lines):
     }
 
 
-    for i, line in enumerate(text_content_lines):
-        match_id = re.search(r"(\d+/\d{4})\s+Sb\.", line)
-        if match_id:
-            metadata["law_id"] = match_id.group(1) + " Sb."
-            if i + 1 < len(text_content_lines) and not text_content_lines[i + 1].startswith("§"):
-                title_candidate_line = ""
-                for j in range(i + 1, min(i + 5, len(text_content_lines))):
-                    current_line_lower = text_content_lines[j].lower()
-                    if text_content_lines[j].startswith("§") or "ČÁST" in text_content_lines[j] or "HLAVA" in \
-                            text_content_lines[j]:
-                        break
-                    if "o " in current_line_lower or "kterým se mění" in current_line_lower or "ze dne" in current_line_lower:
-                        title_candidate_line += text_content_lines[j] + " "
-                    elif title_candidate_line:
-                        title_candidate_line += text_content_lines[j] + " "
-
-                if title_candidate_line:
-
-                    title_candidate_line = re.sub(r"^\s*ze dne\s+\d+\.\s+\w+\s+\d{4}\s*", "",
-                                                  title_candidate_line.strip(), flags=re.IGNORECASE)
-
-                    title_candidate_line = re.sub(r"^(ZÁKON|VYHLÁŠKA|NAŘÍZENÍ VLÁDY)\s*", "", title_candidate_line,
-                                                  flags=re.IGNORECASE).strip()
-                    metadata["title"] = title_candidate_line.strip()
-
-            date_match = re.search(r"ze dne (\d{1,2}\. \w+ \d{4})", " ".join(text_content_lines[:10]),
-                                   re.IGNORECASE)
-            if date_match:
-                metadata["publication_date"] = date_match.group(1)
-            break
-
-
-    for line in reversed(text_content_lines):
-        effective_date_match = re.search(r"nabývá účinnosti dnem\s+(.*)", line, re.IGNORECASE)
-        if effective_date_match:
-            metadata["effective_date"] = effective_date_match.group(1).strip().rstrip('.')
-            break
-
-    for line in text_content_lines:
-        references = re.findall(r"(zákon(?:a|u|ě)? č\.\s*\d+/\d{4}\s*Sb\.)", line, re.IGNORECASE)
-        for ref in references:
-            if ref not in metadata["references"]:
-                metadata["references"].append(ref)
-
-        complex_refs = re.findall(
-            r"(§\s*\d+[a-z]?\s*(?:odst\.\s*\d+)?\s*(?:písm\.\s*[a-z]\))?\s*zákona č\.\s*\d+/\d{4}\s*Sb\.)", line,
-            re.IGNORECASE)
-        for ref in complex_refs:
-            if ref not in metadata["references"]:
-                metadata["references"].append(ref)
+    joined_text = "\n".join(text_content_lines)
+
+    match_id = _LAW_ID_RE.search(joined_text)
+    if match_id:
+        metadata["law_id"] = match_id.group(1) + " Sb."
+        # Line index of the hit, recovered from the joined buffer.
+        i = joined_text.count("\n", 0, match_id.start())
+        if i + 1 < len(text_content_lines) and not text_content_lines[i + 1].startswith("§"):
+            title_candidate_line = ""
+            for j in range(i + 1, min(i + 5, len(text_content_lines))):
+                current_line_lower = text_content_lines[j].lower()
+                if text_content_lines[j].startswith("§") or "ČÁST" in text_content_lines[j] or "HLAVA" in \
+                        text_content_lines[j]:
+                    break
+                if "o " in current_line_lower or "kterým se mění" in current_line_lower or "ze dne" in current_line_lower:
+                    title_candidate_line += text_content_lines[j] + " "
+                elif title_candidate_line:
+                    title_candidate_line += text_content_lines[j] + " "
+
+            if title_candidate_line:
+
+                title_candidate_line = _ZE_DNE_PREFIX_RE.sub("", title_candidate_line.strip())
+
+                title_candidate_line = _DOC_TYPE_PREFIX_RE.sub("", title_candidate_line).strip()
+                metadata["title"] = title_candidate_line.strip()
+
+        date_match = _DATE_RE.search(" ".join(text_content_lines[:10]))
+        if date_match:
+            metadata["publication_date"] = date_match.group(1)
+
+
+    # The effective-date clause sits at the end of the law, so scan the tail
+    # first and only fall back to the rest of the document. The last match
+    # wins, as with the old reversed line-by-line search.
+    effective_date_matches = list(_EFFECTIVE_RE.finditer("\n".join(text_content_lines[-50:])))
+    if not effective_date_matches and len(text_content_lines) > 50:
+        effective_date_matches = list(_EFFECTIVE_RE.finditer("\n".join(text_content_lines[:-50])))
+    if effective_date_matches:
+        metadata["effective_date"] = effective_date_matches[-1].group(1).strip().rstrip('.')
+
+    references = _REFS_RE.findall(joined_text)
+    metadata["references"] = list(dict.fromkeys(references))
 
     return metadata
 
@@ -110,60 +171,78 @@ def remove_duplicated_text(text):
     return text
 
 
+# Node factories: building every subsection dict through one code path
+# keeps the key insertion order identical, so CPython can share the dict
+# key tables across the thousands of nodes a long law produces.
+def _subsection_level1_obj(number, content):
+    # Merge adjacent text fragments here, while the composition of the
+    # content list is still known, instead of re-walking the finished tree
+    # with isinstance checks. content always stays a list — the Neo4j
+    # importer only walks Array content when building subsection text.
+    merged_content = []
+    text_segment = []
+    for content_part in content:
+        if isinstance(content_part, str):
+            text_segment.append(content_part)
+        else:
+            if text_segment:
+                merged_content.append(" ".join(text_segment).strip())
+                text_segment = []
+            merged_content.append(content_part)
+    if text_segment:
+        merged_content.append(" ".join(text_segment).strip())
+    if len(merged_content) == 1 and isinstance(merged_content[0], str):
+        merged_content[0] = remove_duplicated_text(merged_content[0])
+    return {
+        "type": "subsection_level1",
+        "identifier": number,
+        "content": merged_content
+    }
+
+
+def _subsection_level2_obj(letter, text_chunks):
+    return {
+        "type": "subsection_level2",
+        "identifier": letter,
+        "text": remove_duplicated_text(" ".join(text_chunks).strip())
+    }
+
+
 def structure_text_content(text_lines):
     structured_content = []
     current_part = None
     current_head = None
     current_paragraph_number = None
     current_paragraph_text = []
+    current_paragraph_subs = []
     current_subsection_level1_number = None
     current_subsection_level1_text = []
     current_subsection_level2_letter = None
     current_subsection_level2_text = []
 
-
-    part_re = re.compile(r"^\s*ČÁST\s+([A-Z]+|[IVXLCDM]+)", re.IGNORECASE)
-    head_re = re.compile(r"^\s*HLAVA\s+([IVXLCDM]+)", re.IGNORECASE)
-    paragraph_re = re.compile(r"^\s*§\s*(\d+[a-z]?)")  # Matches §1, §1a, etc.
-    subsection_l1_re = re.compile(r"^\s*\((\d+)\)")  # Matches (1), (2) etc.
-    subsection_l2_re = re.compile(r"^\s*([a-z])\)")  # Matches a), b) etc.
-
     def store_previous_item():
-        nonlocal current_paragraph_text, current_subsection_level1_text, current_subsection_level2_text
+        nonlocal current_paragraph_text, current_paragraph_subs
+        nonlocal current_subsection_level1_text, current_subsection_level2_text
         nonlocal current_paragraph_number, current_subsection_level1_number, current_subsection_level2_letter
 
         if current_subsection_level2_text:
+            sub2_obj = _subsection_level2_obj(current_subsection_level2_letter, current_subsection_level2_text)
             if not current_subsection_level1_text:
-                current_paragraph_text.append({
-                    "type": "subsection_level2",
-                    "identifier": current_subsection_level2_letter,
-                    "text": " ".join(current_subsection_level2_text).strip()
-                })
+                current_paragraph_subs.append(sub2_obj)
             else:
-                current_subsection_level1_text.append({
-                    "type": "subsection_level2",
-                    "identifier": current_subsection_level2_letter,
-                    "text": " ".join(current_subsection_level2_text).strip()
-                })
+                current_subsection_level1_text.append(sub2_obj)
             current_subsection_level2_text = []
             current_subsection_level2_letter = None
 
         if current_subsection_level1_text:
-            current_paragraph_text.append({
-                "type": "subsection_level1",
-                "identifier": current_subsection_level1_number,
-                "content": current_subsection_level1_text if isinstance(current_subsection_level1_text, list) else [
-                    current_subsection_level1_text]
-            })
+            current_paragraph_subs.append(
+                _subsection_level1_obj(current_subsection_level1_number, current_subsection_level1_text))
             current_subsection_level1_text = []
             current_subsection_level1_number = None
 
-        if current_paragraph_text and current_paragraph_number:
-            main_text_lines = [item for item in current_paragraph_text if isinstance(item, str)]
-            sub_items = [item for item in current_paragraph_text if isinstance(item, dict)]
-
+        if (current_paragraph_text or current_paragraph_subs) and current_paragraph_number:
             # Join the text and remove duplicated phrases
-            joined_text = " ".join(main_text_lines).strip()
+            joined_text = " ".join(current_paragraph_text).strip()
             deduped_text = remove_duplicated_text(joined_text)
 
             para_obj = {
@@ -171,8 +250,8 @@ def structure_text_content(text_lines):
                 "identifier": f"§ {current_paragraph_number}",
                 "text": deduped_text
             }
-            if sub_items:
-                para_obj["subsections"] = sub_items
+            if current_paragraph_subs:
+                para_obj["subsections"] = current_paragraph_subs
 
             if current_head:
                 current_head["paragraphs"].append(para_obj)
@@ -181,20 +260,22 @@ def structure_text_content(text_lines):
             else:
                 structured_content.append(para_obj)
             current_paragraph_text = []
+            current_paragraph_subs = []
             current_paragraph_number = None
 
+    num_lines = len(text_lines)
     for line_idx, line_text in enumerate(text_lines):
         line_text_stripped = line_text.strip()
         if not line_text_stripped:
             continue
 
-        part_match = part_re.match(line_text_stripped)
-        head_match = head_re.match(line_text_stripped)
-        paragraph_match = paragraph_re.match(line_text_stripped)
-        subsection_l1_match = subsection_l1_re.match(line_text_stripped)
-        subsection_l2_match = subsection_l2_re.match(line_text_stripped)
+        if line_text_stripped[0] in _STRUCT_LEAD_CHARS or line_text_stripped[1:2] == ")":
+            struct_match = _STRUCT_RE.match(line_text_stripped)
+        else:
+            struct_match = None
+        kind = struct_match.lastgroup if struct_match else None
 
-        if part_match:
+        if kind == "part":
             store_previous_item()
             if current_head:
                 if current_part:
@@ -205,12 +286,13 @@ def structure_text_content(text_lines):
             if current_part:
                 structured_content.append(current_part)
 
-            part_id = part_match.group(1)
-            part_title = text_lines[line_idx + 1].strip() if line_idx + 1 < len(text_lines) else ""
-            if line_idx + 2 < len(text_lines) and not (
-                    paragraph_re.match(text_lines[line_idx + 2].strip()) or head_re.match(
-                text_lines[line_idx + 2].strip()) or part_re.match(text_lines[line_idx + 2].strip())):
-                part_title += " " + text_lines[line_idx + 2].strip()
+            part_id = struct_match.group("part")
+            part_title = text_lines[line_idx + 1].strip() if line_idx + 1 < num_lines else ""
+            if line_idx + 2 < num_lines:
+                next2 = text_lines[line_idx + 2].strip()
+                next2_match = _STRUCT_RE.match(next2)
+                if not (next2_match and next2_match.lastgroup in ("part", "head", "para")):
+                    part_title += " " + next2
 
             current_part = {
                 "type": "part",
@@ -221,7 +303,7 @@ def structure_text_content(text_lines):
             }
             continue
 
-        if head_match:
+        if kind == "head":
             store_previous_item()
             if current_head:
                 if current_part:
@@ -229,12 +311,13 @@ def structure_text_content(text_lines):
                 else:
                     structured_content.append(current_head)
 
-            head_id = head_match.group(1)
-            head_title = text_lines[line_idx + 1].strip() if line_idx + 1 < len(text_lines) else ""
-            if line_idx + 2 < len(text_lines) and not (
-                    paragraph_re.match(text_lines[line_idx + 2].strip()) or head_re.match(
-                text_lines[line_idx + 2].strip()) or part_re.match(text_lines[line_idx + 2].strip())):
-                head_title += " " + text_lines[line_idx + 2].strip()
+            head_id = struct_match.group("head")
+            head_title = text_lines[line_idx + 1].strip() if line_idx + 1 < num_lines else ""
+            if line_idx + 2 < num_lines:
+                next2 = text_lines[line_idx + 2].strip()
+                next2_match = _STRUCT_RE.match(next2)
+                if not (next2_match and next2_match.lastgroup in ("part", "head", "para")):
+                    head_title += " " + next2
 
             current_head = {
                 "type": "head",
@@ -244,80 +327,57 @@ def structure_text_content(text_lines):
             }
             continue
 
-        if paragraph_match:
+        if kind == "para":
             store_previous_item()
-            current_paragraph_number = paragraph_match.group(1)
-            text_after_identifier = line_text_stripped[len(paragraph_match.group(0)):].strip()
+            current_paragraph_number = struct_match.group("para")
+            text_after_identifier = line_text_stripped[struct_match.end():].strip()
             if text_after_identifier:
                 current_paragraph_text.append(text_after_identifier)
 
             # Modified section to avoid duplication
-            if line_idx + 1 < len(text_lines):
+            if line_idx + 1 < num_lines:
                 next_line_stripped = text_lines[line_idx + 1].strip()
-                if not (paragraph_re.match(next_line_stripped) or \
-                        subsection_l1_re.match(next_line_stripped) or \
-                        subsection_l2_re.match(next_line_stripped) or \
-                        part_re.match(next_line_stripped) or \
-                        head_re.match(next_line_stripped) or \
-                        next_line_stripped.lower().startswith("§") or \
-                        next_line_stripped.lower().startswith("(") or \
-                        next_line_stripped.lower().startswith("čl.")):
+                if not (_STRUCT_RE.match(next_line_stripped) or \
+                        next_line_stripped.lower().startswith(("§", "(", "čl."))):
 
                     # Check if next line is not a duplicate of text_after_identifier
                     if text_after_identifier and next_line_stripped and \
                             text_after_identifier.lower() != next_line_stripped.lower():
-                        if current_paragraph_text and isinstance(current_paragraph_text[-1], str):
-                            current_paragraph_text[-1] += " " + next_line_stripped
-                        else:
-                            current_paragraph_text.append(next_line_stripped)
+                        current_paragraph_text.append(next_line_stripped)
             continue
 
-        if subsection_l1_match:
+        if kind == "sub1":
 
             if current_subsection_level2_text:
+                sub2_obj = _subsection_level2_obj(current_subsection_level2_letter, current_subsection_level2_text)
                 if not current_subsection_level1_text:
-                    current_paragraph_text.append({
-                        "type": "subsection_level2",
-                        "identifier": current_subsection_level2_letter,
-                        "text": " ".join(current_subsection_level2_text).strip()
-                    })
+                    current_paragraph_subs.append(sub2_obj)
                 else:
-                    current_subsection_level1_text.append({
-                        "type": "subsection_level2",
-                        "identifier": current_subsection_level2_letter,
-                        "text": " ".join(current_subsection_level2_text).strip()
-                    })
+                    current_subsection_level1_text.append(sub2_obj)
                 current_subsection_level2_text = []
                 current_subsection_level2_letter = None
 
             if current_subsection_level1_text:
-                current_paragraph_text.append({
-                    "type": "subsection_level1",
-                    "identifier": current_subsection_level1_number,
-                    "content": current_subsection_level1_text if isinstance(current_subsection_level1_text, list) else [
-                        current_subsection_level1_text]
-                })
-
-            current_subsection_level1_number = subsection_l1_match.group(1)
+                current_paragraph_subs.append(
+                    _subsection_level1_obj(current_subsection_level1_number, current_subsection_level1_text))
+
+            current_subsection_level1_number = struct_match.group("sub1")
             current_subsection_level1_text = []
-            text_after_identifier = line_text_stripped[len(subsection_l1_match.group(0)):].strip()
+            text_after_identifier = line_text_stripped[struct_match.end():].strip()
             if text_after_identifier:
                 current_subsection_level1_text.append(text_after_identifier)
             continue
 
-        if subsection_l2_match:
+        if kind == "sub2":
 
             if current_subsection_level2_text:
-                item_to_append_to = current_subsection_level1_text if current_subsection_level1_number else current_paragraph_text
-                item_to_append_to.append({
-                    "type": "subsection_level2",
-                    "identifier": current_subsection_level2_letter,
-                    "text": " ".join(current_subsection_level2_text).strip()
-                })
-
-            current_subsection_level2_letter = subsection_l2_match.group(1)
+                item_to_append_to = current_subsection_level1_text if current_subsection_level1_number else current_paragraph_subs
+                item_to_append_to.append(
+                    _subsection_level2_obj(current_subsection_level2_letter, current_subsection_level2_text))
+
+            current_subsection_level2_letter = struct_match.group("sub2")
             current_subsection_level2_text = []
-            text_after_identifier = line_text_stripped[len(subsection_l2_match.group(0)):].strip()
+            text_after_identifier = line_text_stripped[struct_match.end():].strip()
             if text_after_identifier:
                 current_subsection_level2_text.append(text_after_identifier)
             continue
@@ -338,40 +398,20 @@ def structure_text_content(text_lines):
     if current_part:
         structured_content.append(current_part)
 
+    return structured_content
+
 
-    for item in structured_content:
-        if item.get("type") == "paragraph" and "subsections" in item:
-            for sub_item in item["subsections"]:
-                if sub_item.get("type") == "subsection_level1" and isinstance(sub_item.get("content"), list):
-
-                    new_content = []
-                    current_text_segment = []
-                    for content_part in sub_item["content"]:
-                        if isinstance(content_part, str):
-                            current_text_segment.append(content_part)
-                        else:
-                            if current_text_segment:
-                                new_content.append(" ".join(current_text_segment).strip())
-                                current_text_segment = []
-                            new_content.append(content_part)
-                    if current_text_segment:
-                        new_content.append(" ".join(current_text_segment).strip())
-                    sub_item["content"] = new_content[0] if len(new_content) == 1 and isinstance(new_content[0],
-                                                                                                 str) else new_content
-
-                    # Also apply deduplication to subsection content if it's a string
-                    if isinstance(sub_item["content"], str):
-                        sub_item["content"] = remove_duplicated_text(sub_item["content"])
-
-
-    # Apply deduplication to subsection level 2 text
-    for item in structured_content:
-        if item.get("type") == "paragraph" and "subsections" in item:
-            for sub_item in item["subsections"]:
-                if sub_item.get("type") == "subsection_level2" and "text" in sub_item:
-                    sub_item["text"] = remove_duplicated_text(sub_item["text"])
+# Plain text-only extraction: ligatures come back expanded to ordinary
+# letters, which is also what the regex pipeline expects.
+_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES
 
-    return structured_content
+
+def _iter_raw_lines(doc):
+    # Lines flow straight into the cleanup filter page by page, so the
+    # raw per-page text is never materialized as one big list.
+    for page in doc:
+        textpage = page.get_textpage(flags=_TEXT_FLAGS)
+        yield from textpage.extractText().splitlines()
 
 
 def pdf_to_structured_json(pdf_path, json_path):
@@ -382,32 +422,32 @@ def pdf_to_structured_json(pdf_path, json_path):
         print(f"Error opening PDF {pdf_path}: {e}")
         return
 
-    all_text_lines = []
-    for page_num in range(len(doc)):
-        page = doc.load_page(page_num)
-        text = page.get_text("text")
-        all_text_lines.extend(text.split('\n'))
-
-
-    all_text_lines = [line for line in all_text_lines if not re.match(r"^-+ PAGE \d+ -+$", line)]
-
-
-    cleaned_lines = []
-    for line in all_text_lines:
-        stripped_line = line.strip()
-        if re.fullmatch(r"strana \d+", stripped_line, re.IGNORECASE):
-            continue
-        if re.fullmatch(r"\d+", stripped_line) and (len(cleaned_lines) > 0 and len(cleaned_lines[-1]) > 60 or len(
-                cleaned_lines) == 0):
-            continue  # Skip page numbers
-
-        # Skip repeated headers
-        if page_num > 0 and stripped_line == doc[0].get_text("blocks")[0][4].split('\n')[0].strip():
-            continue
-
-        # Only add non-empty lines
-        if stripped_line:
-            cleaned_lines.append(stripped_line)
+    with doc:
+        # The first line of page 0 repeats as a header on later pages; extract
+        # it once instead of re-parsing page 0 per line below.
+        header_probe = ""
+        if len(doc) > 0:
+            first_blocks = doc[0].get_text("blocks")
+            if first_blocks:
+                header_probe = first_blocks[0][4].split('\n')[0].strip()
+        multi_page = len(doc) > 1
+
+        cleaned_lines = []
+        for line in _iter_raw_lines(doc):
+            stripped_line = line.strip()
+            if stripped_line[:7].lower() == "strana " and stripped_line[7:].isdigit():
+                continue
+            if stripped_line.isdigit() and (len(cleaned_lines) > 0 and len(cleaned_lines[-1]) > 60 or len(
+                    cleaned_lines) == 0):
+                continue  # Skip page numbers
+
+            # Skip repeated headers
+            if multi_page and stripped_line == header_probe:
+                continue
+
+            # Only add non-empty lines
+            if stripped_line:
+                cleaned_lines.append(stripped_line)
 
     metadata = extract_metadata(cleaned_lines)
     metadata["source_file"] = os.path.basename(pdf_path)
@@ -417,13 +457,22 @@ def pdf_to_structured_json(pdf_path, json_path):
 
     output_data = {
         "metadata": metadata,
-        "text_content": cleaned_lines,
         "structured_text": structured_law_text
     }
+    # The flat line list roughly doubles the JSON size, but the Neo4j
+    # importer (src/graph/importer) joins it into the Law node, so it stays
+    # in by default; set INCLUDE_TEXT_CONTENT=0 when only the structured
+    # form is needed.
+    if os.environ.get("INCLUDE_TEXT_CONTENT", "1") != "0":
+        output_data["text_content"] = cleaned_lines
 
     try:
-        with open(json_path, 'w', encoding='utf-8') as jf:
-            json.dump(output_data, jf, ensure_ascii=False, indent=4)
+        if orjson is not None:
+            with open(json_path, 'wb') as jf:
+                jf.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_path, 'w', encoding='utf-8') as jf:
+                json.dump(output_data, jf, ensure_ascii=False, indent=4)
         print(f"Successfully converted {pdf_path} to {json_path}")
     except Exception as e:
         print(f"Error writing JSON to {json_path}: {e}")
@@ -433,9 +482,7 @@ if __name__ == "__main__":
     input_directory = "e-sbirka_data"
     output_directory = "output"
 
-    if not os.path.exists(output_directory):
-        os.makedirs(output_directory)
-        print(f"Created output directory: '{output_directory}'")
+    os.makedirs(output_directory, exist_ok=True)
 
 
     if not os.path.exists(input_directory) or not os.path.isdir(input_directory):
@@ -443,25 +490,35 @@ if __name__ == "__main__":
         print("Please ensure the directory exists and contains PDF files.")
     else:
         print(f"Scanning for PDF files in '{input_directory}'...")
-        found_pdf_files = False
-        for filename in os.listdir(input_directory):
-            if filename.lower().endswith(".pdf"):
-                found_pdf_files = True
-                input_pdf_path = os.path.join(input_directory, filename)
-
-
-                output_json_filename = os.path.splitext(filename)[0] + ".json"
-                output_json_path = os.path.join(output_directory, output_json_filename)
-
-                print(f"Processing '{input_pdf_path}'...")
-                try:
-
-                    pdf_to_structured_json(input_pdf_path, output_json_path)
-                    print(f"Successfully processed '{input_pdf_path}' to '{output_json_path}'")
-                except Exception as e:
-                    print(f"Error processing file '{input_pdf_path}': {e}")
-
-        if not found_pdf_files:
+        with os.scandir(input_directory) as entries:
+            pdf_entries = [entry for entry in entries
+                           if entry.is_file() and entry.name.lower().endswith(".pdf")]
+        # Biggest laws first: DirEntry.stat() is cached by scandir, and
+        # front-loading the long jobs keeps the pool's tail short.
+        pdf_entries.sort(key=lambda entry: entry.stat().st_size, reverse=True)
+        pdf_jobs = [
+            (entry.path, os.path.join(output_directory, os.path.splitext(entry.name)[0] + ".json"))
+            for entry in pdf_entries
+        ]
+
+        if pdf_jobs:
+            # Each PDF is independent and the parsing is CPU-bound, so fan
+            # the files out across processes. Throughput plateaus after a
+            # handful of workers (the pool is disk-bound beyond that), so
+            # don't spawn one per core on big machines.
+            with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, 6)) as executor:
+                futures = {
+                    executor.submit(pdf_to_structured_json, in_path, out_path): in_path
+                    for in_path, out_path in pdf_jobs
+                }
+                for future in as_completed(futures):
+                    in_path = futures[future]
+                    try:
+                        future.result()
+                        print(f"Successfully processed '{in_path}'")
+                    except Exception as e:
+                        print(f"Error processing file '{in_path}': {e}")
+        else:
             print(f"No PDF files found in '{input_directory}'.")
 
     print("Script finished.")
\ No newline at end of file